@@ -0,0 +1,61 @@
+"""Compare analytic derivatives from OilSimulator.evaluate() with central
+finite differences, which need two extra runs per parameter per well."""
+
+import timeit
+
+import numpy as np
+
+from oil_reservoir_synthesizer import OilSimulator
+
+NUM_WELLS = 10
+TIMES = np.linspace(0.0, 1.0, 1000)
+SCALE = 1.0 / len(TIMES)
+EPSILON = 1e-6
+PARAMETERS = {"offset": 0.05, "divergence_scale": 1.0}
+
+
+def simulator(perturbed_well=None, parameter=None, delta=0.0):
+    sim = OilSimulator()
+    for well in range(NUM_WELLS):
+        parameters = dict(PARAMETERS)
+        if well == perturbed_well:
+            parameters[parameter] += delta
+        sim.add_well(f"OP{well}", seed=well + 1, **parameters)
+    return sim
+
+
+def analytic():
+    result = simulator().evaluate(TIMES, SCALE, derivatives=True)
+    return {parameter: result.jacobian("fopt", parameter) for parameter in PARAMETERS}
+
+
+def finite_differences():
+    jacobians = {}
+    for parameter in PARAMETERS:
+        columns = []
+        for well in range(NUM_WELLS):
+            upper = simulator(well, parameter, EPSILON).evaluate(TIMES, SCALE)
+            lower = simulator(well, parameter, -EPSILON).evaluate(TIMES, SCALE)
+            columns.append((upper.fopt() - lower.fopt()) / (2 * EPSILON))
+        jacobians[parameter] = np.column_stack(columns)
+    return jacobians
+
+
+def main():
+    repeats = 3
+    analytic_time = min(timeit.repeat(analytic, number=1, repeat=repeats))
+    fd_time = min(timeit.repeat(finite_differences, number=1, repeat=repeats))
+
+    print(f"{NUM_WELLS} wells, {len(TIMES)} report times")
+    print(f"analytic:           {analytic_time:8.4f} s")
+    print(f"finite differences: {fd_time:8.4f} s")
+    print(f"speedup:            {fd_time / analytic_time:8.1f}x")
+
+    expected, actual = finite_differences(), analytic()
+    for parameter in PARAMETERS:
+        error = np.max(np.abs(expected[parameter] - actual[parameter]))
+        print(f"max |analytic - fd| d(fopt)/d({parameter}): {error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Report the compression ratio and read/write throughput of the trajectory
+store for an ensemble of simulated realizations."""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from oil_reservoir_synthesizer import OilSimulator, TrajectoryReader, TrajectoryWriter
+
+NUM_REALIZATIONS = 20
+NUM_WELLS = 10
+TIMES = np.linspace(0.0, 1.0, 2000)
+FIELD_VECTORS = ["fopr", "fopt", "fgpr", "fgpt", "fwpr", "fwpt", "fgor", "fwct"]
+WELL_VECTORS = ["opr", "opt", "gpr", "gpt", "wpr", "wpt"]
+CONFIGURATIONS = [
+    ("float64", 0),
+    ("float64", 6),
+    ("float32", 0),
+    ("float32", 1),
+    ("float32", 6),
+]
+
+
+def ensemble():
+    vectors = FIELD_VECTORS + [
+        f"{vector}:OP{well}" for well in range(NUM_WELLS) for vector in WELL_VECTORS
+    ]
+    realizations = []
+    for realization in range(NUM_REALIZATIONS):
+        sim = OilSimulator()
+        for well in range(NUM_WELLS):
+            sim.add_well(f"OP{well}", seed=realization * NUM_WELLS + well + 1)
+        result = sim.evaluate(TIMES, scale=1.0 / len(TIMES))
+        columns = [getattr(result, vector)() for vector in FIELD_VECTORS]
+        columns += [
+            getattr(result, vector)(f"OP{well}")
+            for well in range(NUM_WELLS)
+            for vector in WELL_VECTORS
+        ]
+        realizations.append(np.column_stack(columns))
+    return vectors, realizations
+
+
+def write(path, vectors, realizations, dtype, level):
+    """Write the realizations and return the time it took."""
+    start = time.perf_counter()
+    with TrajectoryWriter(
+        path, vectors, dtype=dtype, compression_level=level
+    ) as writer:
+        for realization, values in enumerate(realizations):
+            writer.append(realization, values)
+    return time.perf_counter() - start
+
+
+def read_all(reader):
+    """Read every realization and return the time it took."""
+    start = time.perf_counter()
+    for realization in range(reader.num_realizations):
+        reader.read(realization)
+    return time.perf_counter() - start
+
+
+def read_random_chunks(reader, num_reads, rng):
+    """Read random chunks and return the time it took."""
+    num_step_chunks = (len(TIMES) + reader.chunk_steps - 1) // reader.chunk_steps
+    num_vector_chunks = (
+        len(reader.vectors) + reader.chunk_vectors - 1
+    ) // reader.chunk_vectors
+    keys = np.column_stack(
+        [
+            rng.integers(reader.num_realizations, size=num_reads),
+            rng.integers(num_step_chunks, size=num_reads),
+            rng.integers(num_vector_chunks, size=num_reads),
+        ]
+    )
+    start = time.perf_counter()
+    for key in keys:
+        np.asarray(reader.chunk(*key)).sum()
+    return time.perf_counter() - start
+
+
+def main():
+    vectors, realizations = ensemble()
+    print(
+        f"{NUM_REALIZATIONS} realizations x {len(TIMES)} steps x "
+        f"{len(vectors)} vectors"
+    )
+    print(
+        f"{'dtype':>8} {'level':>5} {'ratio':>7} {'write MB/s':>11} "
+        f"{'read MB/s':>10} {'chunk reads/s':>14}"
+    )
+
+    num_reads = 1000
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        for dtype, level in CONFIGURATIONS:
+            path = Path(directory) / f"{dtype}_{level}"
+            raw_bytes = sum(r.size for r in realizations) * np.dtype(dtype).itemsize
+            write_time = write(path, vectors, realizations, dtype, level)
+            with TrajectoryReader(path) as reader:
+                ratio = raw_bytes / reader.stored_bytes
+                read_time = read_all(reader)
+                chunk_time = read_random_chunks(reader, num_reads, rng)
+
+            print(
+                f"{dtype:>8} {level:>5} {ratio:>7.2f} "
+                f"{raw_bytes / 1e6 / write_time:>11.1f} "
+                f"{raw_bytes / 1e6 / read_time:>10.1f} {num_reads / chunk_time:>14.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ on perlin noise. See :py:class:`OilSimulator`.
 from importlib.metadata import version
 
 from ._oil_simulator import OilSimulator
+from ._simulation_result import SimulationResult
+from ._trajectory_store import TrajectoryReader, TrajectoryWriter
 
 __author__ = """Equinor"""
 __email__ = "fg_sib-scout@equinor.com"
@@ -14,4 +16,7 @@ __version__ = version(__name__)
 
 __all__ = [
     "OilSimulator",
+    "SimulationResult",
+    "TrajectoryReader",
+    "TrajectoryWriter",
 ]
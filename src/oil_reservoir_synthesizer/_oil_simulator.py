@@ -1,7 +1,109 @@
 # ruff: noqa: PLR2004
 from warnings import warn
 
+import numpy as np
+
 from ._shaped_perlin import ShapeCreator, ShapeFunction
+from ._simulation_result import WELL_PARAMETERS, SimulationResult
+
+
+def _check_schedule(times, scale):
+    if times.ndim != 1:
+        raise ValueError(f"Report times must be one dimensional: {times}")
+    if np.any(np.diff(times) < 0.0):
+        raise ValueError(f"Report times must be non-decreasing: {times}")
+    if not np.all((times >= 0.0) & (times <= 1.0)):
+        raise ValueError(f"Report times must be within [0.0, 1.0]: {times}")
+    if not scale > 0.0:
+        raise ValueError(f"Scale must be positive: {scale}")
+
+
+def _trapezoid(values, intervals):
+    """The integral over each interval between consecutive values."""
+    return (values[:-1] + values[1:]) * 0.5 * intervals
+
+
+def _accumulate_phase(  # noqa: PLR0913
+    phase, in_place, intervals, wells, field, well_jacobians, field_jacobians
+):
+    """Accumulate the totals and in place of one phase.
+
+    The rates of the wells are sampled at time 0.0 and at each report time,
+    and are replaced by the rates at the report times once accumulated.
+    Derivatives are accumulated the same way unless well_jacobians is None.
+    """
+    rate, total, fip = f"{phase}pr", f"{phase}pt", f"f{phase}ip"
+    potential = sum(
+        (well[rate] for well in wells.values()), np.zeros(len(intervals) + 1)
+    )
+    produced = np.cumsum(_trapezoid(potential, intervals))
+    # Rates are never negative, so the in place only decreases and
+    # production stops for good the first time it is depleted.
+    producing = in_place - np.concatenate(([0.0], produced[:-1])) > 0.0
+
+    field[f"f{rate}"] = np.zeros_like(intervals)
+    for well in wells.values():
+        well[total] = np.cumsum(
+            np.where(producing, _trapezoid(well[rate], intervals), 0.0)
+        )
+        well[rate] = np.where(producing, well[rate][1:], 0.0)
+        field[f"f{rate}"] += well[rate]
+    field[f"f{total}"] = np.cumsum(
+        np.where(producing, _trapezoid(potential, intervals), 0.0)
+    )
+    field[fip] = np.maximum(in_place - field[f"f{total}"], 0.0)
+
+    if well_jacobians is not None:
+        _accumulate_phase_jacobians(
+            (rate, total, fip),
+            producing,
+            intervals,
+            field,
+            well_jacobians,
+            field_jacobians,
+        )
+
+
+def _accumulate_phase_jacobians(  # noqa: PLR0913
+    vectors, producing, intervals, field, well_jacobians, field_jacobians
+):
+    """Accumulate the derivatives of the totals and in place of one phase
+    like :py:func:`_accumulate_phase` does for the values."""
+    rate, total, fip = vectors
+    for parameter in WELL_PARAMETERS:
+        for jacobian in well_jacobians.values():
+            d_rate = jacobian[rate][parameter]
+            jacobian.setdefault(total, {})[parameter] = np.cumsum(
+                np.where(producing, _trapezoid(d_rate, intervals), 0.0)
+            )
+            jacobian[rate][parameter] = np.where(producing, d_rate[1:], 0.0)
+        for vector in (rate, total):
+            columns = [
+                jacobian[vector][parameter] for jacobian in well_jacobians.values()
+            ]
+            field_jacobians[f"f{vector}", parameter] = (
+                np.array(columns).reshape(len(well_jacobians), len(intervals)).T
+            )
+        field_jacobians[fip, parameter] = np.where(
+            field[fip][:, np.newaxis] > 0.0,
+            -field_jacobians[f"f{total}", parameter],
+            0.0,
+        )
+
+
+def _add_ratios(wells, field, num_times):
+    """Add the gas oil ratios and water cuts of the wells and the field."""
+    field["fgor"] = np.zeros(num_times)
+    field["fwct"] = np.zeros(num_times)
+    for well in wells.values():
+        opr = np.maximum(well["opr"], 0.1)
+        well["gor"] = np.maximum(well["gpr"], 0.1) / opr
+        well["wct"] = well["wpr"] / (well["wpr"] + opr)
+        field["fgor"] += well["gor"]
+        field["fwct"] += well["wct"]
+    if wells:
+        field["fgor"] /= len(wells)
+        field["fwct"] /= len(wells)
 
 
 class OilSimulator:
@@ -181,6 +283,92 @@ class OilSimulator:
 
         self._current_step += 1
 
+    def _sample_well_rates(self, times, derivatives):
+        wells = {key: {} for key in self._wells}
+        well_jacobians = {key: {} for key in self._wells}
+        for rate, functions in (
+            ("opr", self._opr_func),
+            ("gpr", self._gpr_func),
+            ("wpr", self._wpr_func),
+        ):
+            for key, well in wells.items():
+                if derivatives:
+                    well[rate], d_offset, d_divergence_scale = functions[key].sample(
+                        times, derivatives=True
+                    )
+                    well_jacobians[key][rate] = {
+                        "offset": d_offset,
+                        "divergence_scale": d_divergence_scale,
+                    }
+                else:
+                    well[rate] = functions[key].sample(times)
+        return wells, well_jacobians
+
+    def evaluate(self, times, scale=1.0, derivatives=False):
+        """Evaluate the model at a schedule of report times in one pass.
+
+        Unlike :py:meth:`step`, the report times need not be evenly spaced,
+        so the schedule can be dense where detail is needed and sparse
+        elsewhere. Evaluation always starts from the initial conditions and
+        does not change the state used by :py:meth:`step`.
+
+        Totals integrate the rates over time from 0.0 with the trapezoid
+        rule between consecutive report times, so they do not depend on
+        sampling the rates more densely than the schedule resolves them. A
+        phase stops producing once its field in place is depleted at the
+        start of an interval.
+
+        Until a phase is depleted, the rates are the same as those of
+        :py:meth:`step` at the same times, but the totals are not:
+        :py:meth:`step` adds the full rate at each step, which for evenly
+        spaced times starting at 0.0 exceeds the integral by half of the
+        first and half of the current rate. Once a phase is depleted, its
+        well rates are 0.0 here, while :py:meth:`step` keeps the last well
+        rates and computes the gas oil ratios and water cuts from them.
+
+        :param times: Non-decreasing normalized times from 0.0 to 1.0.
+        :param scale: The normalized length of one unit of time, as passed
+            to :py:meth:`step`. Totals integrate the rates over time measured
+            in this unit.
+        :param derivatives: Whether to also compute the derivatives of the
+            rates, totals and in place volumes with respect to the
+            ``offset`` and ``divergence_scale`` of each well, see
+            :py:meth:`SimulationResult.jacobian`. Derivatives are zero where
+            a rate is cut off at zero, where a phase is depleted and where
+            the in place is clamped at zero.
+        :rtype: SimulationResult
+        """
+        times = np.asarray(times, dtype=float)
+        _check_schedule(times, scale)
+        # The rates are also sampled at time 0.0 so that the first interval
+        # can be integrated like the others.
+        grid = np.concatenate(([0.0], times))
+        intervals = np.diff(grid) / scale
+
+        wells, well_jacobians = self._sample_well_rates(grid, derivatives)
+
+        field = {}
+        field_jacobians = {}
+        for phase, in_place in (("o", self.ooip), ("g", self.goip), ("w", self.woip)):
+            _accumulate_phase(
+                phase,
+                in_place,
+                intervals,
+                wells,
+                field,
+                well_jacobians if derivatives else None,
+                field_jacobians,
+            )
+        _add_ratios(wells, field, len(times))
+
+        blocks = {key: self._bpr_func[key].sample(times) for key in self._bpr}
+
+        if not derivatives:
+            return SimulationResult(times, field, wells, blocks)
+        return SimulationResult(
+            times, field, wells, blocks, field_jacobians, well_jacobians
+        )
+
     def fopt(self):
         """Get the field oil production total at the current time."""
         return self._fopt
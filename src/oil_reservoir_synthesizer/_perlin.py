@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 from ._prime_generator import PrimeGenerator
 
 
@@ -25,6 +27,19 @@ class PerlinNoise:
         x = (x * (x * x * 15731 + 789221) + 1376312589) & PerlinNoise.MAX_INT
         return 1.0 - x / 1073741824.0
 
+    def noise_array(self, x, perturbation):
+        """Vectorized :py:meth:`noise` for an array of integers.
+
+        The arithmetic wraps around in 64 bits, which leaves the
+        masked lower 31 bits identical to the unbounded computation.
+        """
+        x = (x + perturbation).astype(np.uint64)
+        x = ((x << np.uint64(13)) & np.uint64(PerlinNoise.MAX_INT)) ^ x
+        x = (
+            x * (x * x * np.uint64(15731) + np.uint64(789221)) + np.uint64(1376312589)
+        ) & np.uint64(PerlinNoise.MAX_INT)
+        return 1.0 - x / 1073741824.0
+
     def smoothed_noise(self, x, perturbation):
         return (
             self.noise(x, perturbation) / 2.0
@@ -32,6 +47,13 @@ class PerlinNoise:
             + self.noise(x + 1, perturbation) / 4.0
         )
 
+    def smoothed_noise_array(self, x, perturbation):
+        return (
+            self.noise_array(x, perturbation) / 2.0
+            + self.noise_array(x - 1, perturbation) / 4.0
+            + self.noise_array(x + 1, perturbation) / 4.0
+        )
+
     def interpolated_noise(self, x, octave_number):
         int_x = int(x)
         frac_x = x - int_x
@@ -43,6 +65,18 @@ class PerlinNoise:
 
         return self.cosine_interppolation(v1, v2, frac_x)
 
+    def interpolated_noise_array(self, x, octave_number):
+        int_x = x.astype(np.int64)
+        frac_x = x - int_x
+
+        perturbation = self.octave_primes[octave_number]
+
+        v1 = self.smoothed_noise_array(int_x, perturbation)
+        v2 = self.smoothed_noise_array(int_x + 1, perturbation)
+
+        f = (1.0 - np.cos(frac_x * 3.1415927)) * 0.5
+        return v1 * (1 - f) + v2 * f
+
     def perlin_noise_1d(self, x):
         total = 0.0
 
@@ -56,6 +90,27 @@ class PerlinNoise:
 
         return total
 
+    def perlin_noise_1d_array(self, x):
+        total = np.zeros_like(x)
+
+        for octave in range(int(self.number_of_octaves) - 1):
+            frequency = math.pow(2, octave)
+            amplitude = math.pow(self.persistence, octave)
+
+            total += (
+                self.interpolated_noise_array(x * frequency, octave_number=octave)
+                * amplitude
+            )
+
+        return total
+
+    def sample(self, x):
+        """Evaluate the noise at an array of non-negative positions.
+
+        :rtype: numpy.ndarray
+        """
+        return self.perlin_noise_1d_array(np.asarray(x, dtype=float) * 10.0)
+
     def __getitem__(self, x):
         """:rtype: float"""
         return self.perlin_noise_1d(x * 10.0)
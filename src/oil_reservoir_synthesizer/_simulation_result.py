@@ -0,0 +1,178 @@
+import numpy as np
+
+WELL_PARAMETERS = ("offset", "divergence_scale")
+FIELD_JACOBIAN_VECTORS = (
+    "fopr",
+    "fopt",
+    "fgpr",
+    "fgpt",
+    "fwpr",
+    "fwpt",
+    "foip",
+    "fgip",
+    "fwip",
+)
+WELL_JACOBIAN_VECTORS = ("opr", "opt", "gpr", "gpt", "wpr", "wpt")
+
+
+class SimulationResult:
+    """The values of an :py:class:`OilSimulator` at a schedule of report times.
+
+    Returned by :py:meth:`OilSimulator.evaluate`. The accessors mirror those
+    of :py:class:`OilSimulator`, but return one value per report time as a
+    numpy array instead of the value at the current time.
+
+    :param times: The normalized report times.
+    :param field: Field vectors keyed by name, e.g. ``"fopr"``.
+    :param wells: Well vectors keyed by well name and then by vector name,
+        e.g. ``"opr"``.
+    :param blocks: Block pressures keyed by block name.
+    :param field_jacobians: Derivatives of field vectors keyed by vector
+        name and parameter, with one column per well.
+    :param well_jacobians: Derivatives of well vectors with respect to the
+        parameters of the same well, keyed by well name, vector name and
+        parameter.
+    """
+
+    # pylint: disable=too-many-public-methods
+
+    def __init__(  # noqa: PLR0913
+        self, times, field, wells, blocks, field_jacobians=None, well_jacobians=None
+    ):
+        self.times = times
+        self._field = field
+        self._wells = wells
+        self._blocks = blocks
+        self._field_jacobians = field_jacobians
+        self._well_jacobians = well_jacobians
+
+    @property
+    def wells(self):
+        """The names of the wells in the model."""
+        return list(self._wells)
+
+    @property
+    def blocks(self):
+        """The names of the blocks in the model."""
+        return list(self._blocks)
+
+    def fopt(self):
+        """Get the field oil production total at each report time."""
+        return self._field["fopt"]
+
+    def fopr(self):
+        """Get the field oil production rate at each report time."""
+        return self._field["fopr"]
+
+    def fgpt(self):
+        """Get the field gas production total at each report time."""
+        return self._field["fgpt"]
+
+    def fgpr(self):
+        """Get the field gas production rate at each report time."""
+        return self._field["fgpr"]
+
+    def fwpt(self):
+        """Get the field water production total at each report time."""
+        return self._field["fwpt"]
+
+    def fwpr(self):
+        """Get the field water production rate at each report time."""
+        return self._field["fwpr"]
+
+    def fgor(self):
+        """Get the field gas oil ratio at each report time."""
+        return self._field["fgor"]
+
+    def fwct(self):
+        """Get the field water cut at each report time."""
+        return self._field["fwct"]
+
+    def foip(self):
+        """Get the field oil in place at each report time."""
+        return self._field["foip"]
+
+    def fgip(self):
+        """Get the field gas in place at each report time."""
+        return self._field["fgip"]
+
+    def fwip(self):
+        """Get the field water in place at each report time."""
+        return self._field["fwip"]
+
+    def opr(self, well_name):
+        """Get the oil rate for the given well at each report time."""
+        return self._wells[well_name]["opr"]
+
+    def opt(self, well_name):
+        """Get the oil production total for the given well at each report time."""
+        return self._wells[well_name]["opt"]
+
+    def gpr(self, well_name):
+        """Get the gas rate for the given well at each report time."""
+        return self._wells[well_name]["gpr"]
+
+    def gpt(self, well_name):
+        """Get the gas production total for the given well at each report time."""
+        return self._wells[well_name]["gpt"]
+
+    def wpr(self, well_name):
+        """Get the water rate for the given well at each report time."""
+        return self._wells[well_name]["wpr"]
+
+    def wpt(self, well_name):
+        """Get the water production total for the given well at each report
+        time."""
+        return self._wells[well_name]["wpt"]
+
+    def wct(self, well_name):
+        """Get the water cut for the given well at each report time."""
+        return self._wells[well_name]["wct"]
+
+    def gor(self, well_name):
+        """Get the gas oil ratio for the given well at each report time."""
+        return self._wells[well_name]["gor"]
+
+    def bpr(self, block_name):
+        """Get the block pressure for the given block at each report time."""
+        return self._blocks[block_name]
+
+    def jacobian(self, vector, parameter, well_name=None):
+        """Get the derivatives of a vector with respect to a well parameter.
+
+        Only available when the result was evaluated with
+        ``derivatives=True``.
+
+        :param vector: The name of a rate, total or in place vector, e.g.
+            ``"fopt"`` for the field or ``"opr"`` for a well.
+        :param parameter: Either ``"offset"`` or ``"divergence_scale"``.
+        :param well_name: The well of a well vector, None for field vectors.
+        :returns: An array with a row for each report time and a column for
+            the parameter of each well, in the order of :py:attr:`wells`.
+        """
+        if self._field_jacobians is None:
+            raise ValueError(
+                "Derivatives were not computed, use evaluate(derivatives=True)"
+            )
+        if parameter not in WELL_PARAMETERS:
+            raise ValueError(
+                f"Unknown parameter {parameter!r}, expected one of {WELL_PARAMETERS}"
+            )
+        if well_name is None:
+            if vector not in FIELD_JACOBIAN_VECTORS:
+                raise ValueError(
+                    f"No derivatives of field vector {vector!r}, expected one "
+                    f"of {FIELD_JACOBIAN_VECTORS}"
+                )
+            return self._field_jacobians[vector, parameter]
+
+        if vector not in WELL_JACOBIAN_VECTORS:
+            raise ValueError(
+                f"No derivatives of well vector {vector!r}, expected one "
+                f"of {WELL_JACOBIAN_VECTORS}"
+            )
+
+        derivatives = self._well_jacobians[well_name][vector][parameter]
+        result = np.zeros((len(self.times), len(self._wells)))
+        result[:, self.wells.index(well_name)] = derivatives
+        return result
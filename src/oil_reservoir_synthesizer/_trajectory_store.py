@@ -0,0 +1,358 @@
+# ruff: noqa: PLR2004
+import json
+import numbers
+import struct
+import zlib
+
+import numpy as np
+
+MAGIC = b"ORSTRAJ1"
+TRAILER = struct.Struct("<QQ8s")  # footer offset, metadata length, magic
+
+
+class TrajectoryWriter:
+    """Writes (realization x step x vector) trajectories to a chunked file.
+
+    The values of each realization are split into chunks of ``chunk_steps``
+    steps and ``chunk_vectors`` vectors which are compressed independently,
+    so that any chunk can be read back without touching the others, see
+    :py:class:`TrajectoryReader`. Steps are appended while they are
+    generated and only the steps of chunks that are not yet full are kept
+    in memory. The file is complete once the writer is closed.
+
+    :param path: The file to write.
+    :param vectors: The names of the vectors, one per column of the values.
+    :param chunk_steps: The number of steps in each chunk.
+    :param chunk_vectors: The number of vectors in each chunk.
+    :param dtype: The floating point type the values are stored as.
+    :param compression_level: The zlib compression level from 0 to 9. With
+        0 the chunks are stored uncompressed and can be memory mapped.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path,
+        vectors,
+        chunk_steps=64,
+        chunk_vectors=16,
+        dtype="float32",
+        compression_level=6,
+    ):
+        self.dtype = np.dtype(dtype)
+        if self.dtype.kind != "f":
+            raise ValueError(f"Storage type must be floating point: {dtype}")
+        if chunk_steps < 1 or chunk_vectors < 1:
+            raise ValueError(
+                f"Chunk sizes must be positive: {chunk_steps} x {chunk_vectors}"
+            )
+        if not 0 <= compression_level <= 9:
+            raise ValueError(f"Compression level must be 0 to 9: {compression_level}")
+
+        self.vectors = list(vectors)
+        self.chunk_steps = chunk_steps
+        self.chunk_vectors = chunk_vectors
+        self.compression_level = compression_level
+
+        # pylint: disable-next=consider-using-with
+        self._file = open(path, "wb")  # noqa: SIM115
+        self._file.write(MAGIC)
+        self._pending = {}  # Steps not yet written for each realization
+        self._steps = {}  # Number of steps appended to each realization
+        self._written = {}  # Number of steps written for each realization
+        self._index = {}  # (realization, step chunk, vector chunk) -> entry
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def append(self, realization, values):
+        """Append steps to the trajectory of a realization.
+
+        :param realization: The non-negative index of the realization.
+        :param values: The values of one step, with one value per vector, or
+            an array with one row per step.
+        """
+        if self._file.closed:
+            raise ValueError("Cannot append to a closed trajectory writer")
+        if not isinstance(realization, numbers.Integral) or realization < 0:
+            raise IndexError(
+                f"Realization must be a non-negative integer: {realization!r}"
+            )
+        values = np.atleast_2d(np.asarray(values, dtype=self.dtype))
+        if values.ndim != 2 or values.shape[1] != len(self.vectors):
+            raise ValueError(
+                f"Expected {len(self.vectors)} values per step, got {values.shape}"
+            )
+
+        pending = self._pending.setdefault(realization, [])
+        pending.append(values)
+        self._steps[realization] = self._steps.get(realization, 0) + len(values)
+
+        buffered = sum(len(p) for p in pending)
+        if buffered >= self.chunk_steps:
+            buffered = np.concatenate(pending)
+            full = len(buffered) - len(buffered) % self.chunk_steps
+            self._write_chunks(realization, buffered[:full])
+            self._pending[realization] = [buffered[full:]]
+
+    def _write_chunks(self, realization, values):
+        first_step_chunk = self._written.get(realization, 0) // self.chunk_steps
+        self._written[realization] = self._written.get(realization, 0) + len(values)
+        for step in range(0, len(values), self.chunk_steps):
+            for vector in range(0, len(self.vectors), self.chunk_vectors):
+                chunk = np.ascontiguousarray(
+                    values[
+                        step : step + self.chunk_steps,
+                        vector : vector + self.chunk_vectors,
+                    ]
+                )
+                data = chunk.tobytes()
+                compressed = False
+                if self.compression_level > 0:
+                    packed = zlib.compress(data, self.compression_level)
+                    if len(packed) < len(data):
+                        data, compressed = packed, True
+                key = (
+                    realization,
+                    first_step_chunk + step // self.chunk_steps,
+                    vector // self.chunk_vectors,
+                )
+                self._index[key] = (self._file.tell(), len(data), compressed)
+                self._file.write(data)
+
+    def close(self):
+        """Write the remaining steps and the chunk index, and close the file."""
+        if self._file.closed:
+            return
+        for realization, pending in self._pending.items():
+            remaining = np.concatenate(pending)
+            if len(remaining) > 0:
+                self._write_chunks(realization, remaining)
+        self._pending = {}
+
+        num_realizations = max(self._steps, default=-1) + 1
+        steps = [self._steps.get(r, 0) for r in range(num_realizations)]
+        index = np.full(
+            (
+                num_realizations,
+                _ceil_div(max(steps, default=0), self.chunk_steps),
+                _ceil_div(len(self.vectors), self.chunk_vectors),
+                3,
+            ),
+            -1,
+            dtype="<i8",
+        )
+        for key, entry in self._index.items():
+            index[key] = entry
+
+        metadata = json.dumps(
+            {
+                "vectors": self.vectors,
+                "dtype": self.dtype.str,
+                "chunk_steps": self.chunk_steps,
+                "chunk_vectors": self.chunk_vectors,
+                "steps": steps,
+                "index_shape": index.shape,
+            }
+        ).encode()
+        footer_offset = self._file.tell()
+        self._file.write(metadata)
+        self._file.write(index.tobytes())
+        self._file.write(TRAILER.pack(footer_offset, len(metadata), MAGIC))
+        self._file.close()
+
+
+class TrajectoryReader:
+    """Reads trajectories written by :py:class:`TrajectoryWriter`.
+
+    The file is memory mapped, so uncompressed chunks are returned as views
+    of the file and compressed chunks are only decompressed when they are
+    read. Any chunk is found directly through the chunk index.
+
+    :param path: The file to read.
+    """
+
+    def __init__(self, path):
+        self._data = np.memmap(path, dtype=np.uint8, mode="r")
+        if len(self._data) < len(MAGIC) + TRAILER.size or (
+            bytes(self._data[: len(MAGIC)]) != MAGIC
+        ):
+            raise ValueError(f"Not a trajectory file: {path}")
+        footer_offset, metadata_length, magic = TRAILER.unpack(
+            bytes(self._data[len(self._data) - TRAILER.size :])
+        )
+        if magic != MAGIC:
+            raise ValueError(f"Trajectory file was not closed: {path}")
+
+        index_offset = footer_offset + metadata_length
+        metadata = json.loads(bytes(self._data[footer_offset:index_offset]))
+        self.vectors = metadata["vectors"]
+        self.dtype = np.dtype(metadata["dtype"])
+        self.chunk_steps = metadata["chunk_steps"]
+        self.chunk_vectors = metadata["chunk_vectors"]
+        self._steps = metadata["steps"]
+        self._vector_index = {name: i for i, name in enumerate(self.vectors)}
+        index_shape = tuple(metadata["index_shape"])
+        self._index = (
+            self._data[index_offset : len(self._data) - TRAILER.size]
+            .view("<i8")
+            .reshape(index_shape)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Release the memory map of the file."""
+        self._index = None
+        self._data = None
+
+    @property
+    def num_realizations(self):
+        """The number of realizations in the file."""
+        return len(self._steps)
+
+    def num_steps(self, realization):
+        """Get the number of steps stored for the given realization."""
+        return self._steps[realization]
+
+    @property
+    def stored_bytes(self):
+        """The size of the file in bytes."""
+        return len(self._data)
+
+    def chunk(self, realization, step_chunk, vector_chunk):
+        """Get one chunk of the given realization.
+
+        :returns: An array with a row for each step and a column for each
+            vector in the chunk.
+        """
+        if not 0 <= realization < self.num_realizations:
+            raise IndexError(f"No such realization: {realization}")
+        num_step_chunks, num_vector_chunks = self._index.shape[1:3]
+        if (
+            not 0 <= step_chunk < num_step_chunks
+            or not 0 <= vector_chunk < num_vector_chunks
+            or self._index[realization, step_chunk, vector_chunk, 0] < 0
+        ):
+            raise IndexError(
+                f"No chunk {(step_chunk, vector_chunk)} in realization {realization}"
+            )
+        offset, nbytes, compressed = self._index[realization, step_chunk, vector_chunk]
+        columns = min(
+            self.chunk_vectors, len(self.vectors) - vector_chunk * self.chunk_vectors
+        )
+        data = self._data[offset : offset + nbytes]
+        if compressed:
+            return np.frombuffer(zlib.decompress(data), dtype=self.dtype).reshape(
+                -1, columns
+            )
+        return data.view(self.dtype).reshape(-1, columns)
+
+    def read(self, realization, steps=None, vectors=None):
+        """Read part of the trajectory of a realization.
+
+        Only the chunks that overlap the requested steps and vectors are
+        read.
+
+        :param steps: A slice or an array of the steps to read, None for all
+            steps.
+        :param vectors: The names of the vectors to read, None for all
+            vectors.
+        :returns: An array with a row for each step and a column for each
+            vector.
+        """
+        if not 0 <= realization < self.num_realizations:
+            raise IndexError(f"No such realization: {realization}")
+        step_indices = _indices(steps, self.num_steps(realization))
+        if vectors is None:
+            vector_indices = range(len(self.vectors))
+        else:
+            vector_indices = np.array(
+                [self._vector_index[name] for name in vectors], dtype=int
+            )
+
+        result = np.empty((len(step_indices), len(vector_indices)), dtype=self.dtype)
+        column_groups = _group_by_chunk(vector_indices, self.chunk_vectors)
+        for step_chunk, rows, chunk_rows in _group_by_chunk(
+            step_indices, self.chunk_steps
+        ):
+            for vector_chunk, columns, chunk_columns in column_groups:
+                chunk = self.chunk(realization, step_chunk, vector_chunk)
+                result[_cells(rows, columns)] = chunk[_cells(chunk_rows, chunk_columns)]
+        return result
+
+
+def _indices(selection, size):
+    """The indices selected by a slice, an array of indices or None (all) out
+    of size, as a range when they are consecutive."""
+    if selection is None:
+        return range(size)
+    if isinstance(selection, slice):
+        selected = range(size)[selection]
+        return selected if selected.step == 1 else np.array(selected, dtype=int)
+
+    selected = np.asarray(selection, dtype=int)
+    if np.any((selected < -size) | (selected >= size)):
+        raise IndexError(f"Index out of range for size {size}: {selection}")
+    return np.where(selected < 0, selected + size, selected)
+
+
+def _group_by_chunk(indices, chunk_size):
+    """Group indices by the chunk they fall in.
+
+    :param indices: A range with step 1 or an array of indices.
+    :returns: A list of the chunk number, the positions in indices and the
+        indices within the chunk for each run of indices in the same chunk.
+        Consecutive runs are given as slices so that they can be copied
+        without fancy indexing.
+    """
+    if len(indices) == 0:
+        return []
+    if isinstance(indices, range):
+        groups = []
+        for chunk in range(
+            indices.start // chunk_size, _ceil_div(indices.stop, chunk_size)
+        ):
+            start = max(indices.start, chunk * chunk_size)
+            stop = min(indices.stop, (chunk + 1) * chunk_size)
+            groups.append(
+                (
+                    chunk,
+                    slice(start - indices.start, stop - indices.start),
+                    slice(start - chunk * chunk_size, stop - chunk * chunk_size),
+                )
+            )
+        return groups
+
+    chunks = indices // chunk_size
+    runs = np.split(np.arange(len(indices)), np.flatnonzero(np.diff(chunks)) + 1)
+    groups = []
+    for positions in runs:
+        within = indices[positions] % chunk_size
+        if np.all(np.diff(within) == 1):
+            groups.append(
+                (
+                    chunks[positions[0]],
+                    slice(positions[0], positions[-1] + 1),
+                    slice(within[0], within[-1] + 1),
+                )
+            )
+        else:
+            groups.append((chunks[positions[0]], positions, within))
+    return groups
+
+
+def _ceil_div(numerator, denominator):
+    return (numerator + denominator - 1) // denominator
+
+
+def _cells(rows, columns):
+    if isinstance(rows, slice) or isinstance(columns, slice):
+        return rows, columns
+    return np.ix_(rows, columns)
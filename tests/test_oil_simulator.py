@@ -1,6 +1,11 @@
+import numpy as np
 import pytest
 
 from oil_reservoir_synthesizer import OilSimulator
+from oil_reservoir_synthesizer._simulation_result import (
+    FIELD_JACOBIAN_VECTORS,
+    WELL_JACOBIAN_VECTORS,
+)
 
 EXPECTED_VALUES = [
     [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 1.0],
@@ -185,3 +190,195 @@ def test_oil_simulator():
         assert sim.fwip() == pytest.approx(sim.woip - sim.fwpt())
 
         assert values == pytest.approx(EXPECTED_VALUES[report_step])
+
+
+def test_evaluate_uniform_schedule_matches_step():
+    sim = OilSimulator()
+    sim.add_well("OP1", seed=1)
+    sim.add_block("6,6,6", seed=2)
+
+    result = sim.evaluate(np.arange(10) * 0.1, scale=0.1)
+
+    for report_step, expected in enumerate(EXPECTED_VALUES):
+        values = [
+            result.fopr()[report_step],
+            result.fgpr()[report_step],
+            result.fwpr()[report_step],
+            result.fwct()[report_step],
+            result.fgor()[report_step],
+            result.opr("OP1")[report_step],
+            result.gpr("OP1")[report_step],
+            result.wpr("OP1")[report_step],
+            result.gor("OP1")[report_step],
+            result.wct("OP1")[report_step],
+            result.bpr("6,6,6")[report_step],
+        ]
+        assert values == pytest.approx(
+            [expected[i] for i in (0, 2, 4, 6, 7, 8, 9, 10, 11, 12, 13)]
+        )
+
+
+def test_evaluate_totals_integrate_step_rates():
+    sim = OilSimulator()
+    sim.add_well("OP1", seed=1, offset=0.1)
+    sim.add_well("OP2", seed=3, offset=0.2)
+
+    result = sim.evaluate(np.arange(10) * 0.1, scale=0.1)
+
+    for report_step in range(10):
+        sim.step(scale=0.1)
+        fopr = result.fopr()
+        assert fopr[report_step] == pytest.approx(sim.fopr())
+        assert fopr[0] == pytest.approx(0.3)
+
+        # step() adds the full rate at each step, the trapezoid rule only
+        # half of the rates at the ends.
+        correction = (fopr[0] + fopr[report_step]) / 2
+        assert result.fopt()[report_step] == pytest.approx(sim.fopt() - correction)
+        assert result.foip()[report_step] == pytest.approx(sim.foip() + correction)
+
+
+def test_evaluate_non_uniform_schedule():
+    sim = OilSimulator()
+    sim.add_well("OP1", seed=1)
+    sim.add_well("OP2", seed=3, offset=0.1)
+    sim.add_block("6,6,6", seed=2)
+
+    dense_times = np.linspace(0.0, 1.0, 10001)
+    dense = sim.evaluate(dense_times, scale=0.01)
+    # Dense early and sparse late, picked from the dense schedule
+    report_steps = np.concatenate([np.arange(0, 2000, 40), np.arange(2500, 10001, 750)])
+    times = dense_times[report_steps]
+    result = sim.evaluate(times, scale=0.01)
+
+    assert result.opr("OP2") == pytest.approx(dense.opr("OP2")[report_steps])
+    assert result.bpr("6,6,6") == pytest.approx(dense.bpr("6,6,6")[report_steps])
+    assert result.fopr() == pytest.approx(result.opr("OP1") + result.opr("OP2"))
+
+    for vector in ["fopt", "fgpt", "fwpt", "foip", "fgip", "fwip"]:
+        assert getattr(result, vector)() == pytest.approx(
+            getattr(dense, vector)()[report_steps], rel=0.03, abs=0.05
+        )
+    for vector in ["opt", "gpt", "wpt"]:
+        assert getattr(result, vector)("OP1") == pytest.approx(
+            getattr(dense, vector)("OP1")[report_steps], rel=0.03, abs=0.05
+        )
+
+    assert result.fopt() == pytest.approx(result.opt("OP1") + result.opt("OP2"))
+    assert result.foip() == pytest.approx(sim.ooip - result.fopt())
+    assert result.fgip() == pytest.approx(sim.goip - result.fgpt())
+    assert result.fwip() == pytest.approx(sim.woip - result.fwpt())
+
+
+def test_evaluate_stops_producing_when_depleted():
+    sim = OilSimulator(ooip=1.0)
+    sim.add_well("OP1", seed=1)
+
+    result = sim.evaluate(np.linspace(0.0, 1.0, 21), scale=0.05)
+
+    depleted = np.flatnonzero(result.foip() == 0.0)
+    assert len(depleted) > 0
+    assert np.all(result.fopr()[depleted[0] + 1 :] == 0.0)
+    assert np.all(result.fopt()[depleted[0] :] == result.fopt()[depleted[0]])
+    assert np.all(result.fgpr()[1:] > 0.0)
+
+
+@pytest.mark.parametrize(
+    "times, scale",
+    [
+        ([0.5, 0.1], 1.0),
+        ([-0.1, 0.5], 1.0),
+        ([0.5, 1.1], 1.0),
+        ([[0.0, 1.0]], 1.0),
+        ([0.1, np.nan], 1.0),
+        ([0.1, 0.5], 0.0),
+        ([0.1, 0.5], np.nan),
+    ],
+)
+def test_evaluate_rejects_invalid_schedule(times, scale):
+    sim = OilSimulator()
+    sim.add_well("OP1", seed=1)
+
+    with pytest.raises(ValueError):
+        sim.evaluate(times, scale=scale)
+
+
+def _simulator(ooip=2000, **well_parameters):
+    sim = OilSimulator(ooip=ooip)
+    for name, seed in (("OP1", 1), ("OP2", 3)):
+        parameters = {"offset": 0.05, "divergence_scale": 1.0}
+        parameters.update(well_parameters.get(name, {}))
+        sim.add_well(name, seed=seed, **parameters)
+    return sim
+
+
+@pytest.mark.parametrize("parameter", ["offset", "divergence_scale"])
+@pytest.mark.parametrize("well_index, well_name", [(0, "OP1"), (1, "OP2")])
+def test_jacobian_matches_finite_differences(parameter, well_index, well_name):
+    times = np.linspace(0.0, 1.0, 21)
+    result = _simulator().evaluate(times, scale=0.05, derivatives=True)
+
+    epsilon = 1e-6
+    nominal = {"offset": 0.05, "divergence_scale": 1.0}[parameter]
+    upper = _simulator(**{well_name: {parameter: nominal + epsilon}}).evaluate(
+        times, scale=0.05
+    )
+    lower = _simulator(**{well_name: {parameter: nominal - epsilon}}).evaluate(
+        times, scale=0.05
+    )
+
+    for vector in FIELD_JACOBIAN_VECTORS:
+        difference = (getattr(upper, vector)() - getattr(lower, vector)()) / (
+            2 * epsilon
+        )
+        assert result.jacobian(vector, parameter)[:, well_index] == pytest.approx(
+            difference, abs=1e-5
+        )
+
+    for vector in WELL_JACOBIAN_VECTORS:
+        difference = (
+            getattr(upper, vector)(well_name) - getattr(lower, vector)(well_name)
+        ) / (2 * epsilon)
+        jacobian = result.jacobian(vector, parameter, well_name=well_name)
+        assert jacobian[:, well_index] == pytest.approx(difference, abs=1e-5)
+        assert np.all(jacobian[:, 1 - well_index] == 0.0)
+
+
+def test_jacobian_is_zero_where_clamped():
+    sim = _simulator(ooip=1.0, OP2={"offset": -10.0})
+    result = sim.evaluate(np.linspace(0.0, 1.0, 21), scale=0.05, derivatives=True)
+
+    for parameter in ["offset", "divergence_scale"]:
+        assert np.all(result.opr("OP2") == 0.0)
+        assert np.all(result.jacobian("opr", parameter, well_name="OP2") == 0.0)
+        assert np.all(result.jacobian("fopt", parameter)[:, 1] == 0.0)
+
+        depleted = result.foip() == 0.0
+        assert np.any(depleted)
+        assert np.all(result.jacobian("foip", parameter)[depleted] == 0.0)
+        assert np.all(result.jacobian("foip", parameter)[~depleted, 0][1:] < 0.0)
+
+
+@pytest.mark.parametrize(
+    "vector, well_name",
+    [("fgor", None), ("fopr", "OP1"), ("wct", "OP1"), ("bpr", None), ("opr", None)],
+)
+def test_jacobian_rejects_vectors_without_derivatives(vector, well_name):
+    result = _simulator().evaluate(np.linspace(0.0, 1.0, 5), derivatives=True)
+
+    with pytest.raises(ValueError, match="No derivatives"):
+        result.jacobian(vector, "offset", well_name=well_name)
+
+
+def test_jacobian_of_unknown_well():
+    result = _simulator().evaluate(np.linspace(0.0, 1.0, 5), derivatives=True)
+
+    with pytest.raises(KeyError):
+        result.jacobian("opr", "offset", well_name="OP3")
+
+
+def test_jacobian_requires_derivatives():
+    result = _simulator().evaluate(np.linspace(0.0, 1.0, 5))
+
+    with pytest.raises(ValueError):
+        result.jacobian("fopt", "offset")
@@ -0,0 +1,147 @@
+# ruff: noqa: PLR2004
+import numpy as np
+import pytest
+
+from oil_reservoir_synthesizer import OilSimulator, TrajectoryReader, TrajectoryWriter
+
+VECTORS = [f"V{i}" for i in range(7)]
+
+
+def _values(realization, num_steps=50):
+    rng = np.random.default_rng(realization)
+    return rng.random((num_steps, len(VECTORS)))
+
+
+@pytest.mark.parametrize("compression_level", [0, 6])
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_round_trip(tmp_path, dtype, compression_level):
+    path = tmp_path / "trajectories"
+    with TrajectoryWriter(
+        path,
+        VECTORS,
+        chunk_steps=8,
+        chunk_vectors=3,
+        dtype=dtype,
+        compression_level=compression_level,
+    ) as writer:
+        for realization in range(3):
+            writer.append(realization, _values(realization))
+
+    with TrajectoryReader(path) as reader:
+        assert reader.num_realizations == 3
+        assert reader.vectors == VECTORS
+        assert reader.dtype == np.dtype(dtype)
+        for realization in range(3):
+            assert reader.num_steps(realization) == 50
+            values = reader.read(realization)
+            assert values.dtype == np.dtype(dtype)
+            assert np.array_equal(values, _values(realization).astype(dtype))
+
+
+def test_append_single_steps_interleaved(tmp_path):
+    path = tmp_path / "trajectories"
+    with TrajectoryWriter(path, VECTORS, chunk_steps=4, chunk_vectors=2) as writer:
+        for step in range(10):
+            for realization in (1, 0):
+                writer.append(realization, _values(realization, 10)[step])
+        writer.append(1, _values(2, 5))
+
+    with TrajectoryReader(path) as reader:
+        assert reader.num_steps(0) == 10
+        assert reader.num_steps(1) == 15
+        assert np.array_equal(reader.read(0), _values(0, 10).astype("float32"))
+        assert np.array_equal(
+            reader.read(1),
+            np.concatenate([_values(1, 10), _values(2, 5)]).astype("float32"),
+        )
+
+
+def test_random_access(tmp_path):
+    path = tmp_path / "trajectories"
+    with TrajectoryWriter(
+        path, VECTORS, chunk_steps=8, chunk_vectors=3, dtype="float64"
+    ) as writer:
+        writer.append(0, _values(0))
+
+    expected = _values(0)
+    with TrajectoryReader(path) as reader:
+        assert np.array_equal(reader.chunk(0, 2, 1), expected[16:24, 3:6])
+        assert np.array_equal(reader.chunk(0, 6, 2), expected[48:50, 6:7])
+        assert np.array_equal(
+            reader.read(0, steps=slice(5, 42, 3), vectors=["V6", "V0", "V4"]),
+            expected[5:42:3][:, [6, 0, 4]],
+        )
+        assert np.array_equal(reader.read(0, steps=[49, 0]), expected[[49, 0]])
+        assert np.array_equal(
+            reader.read(0, steps=[1, 3, 4, 7], vectors=["V0", "V2"]),
+            expected[[1, 3, 4, 7]][:, [0, 2]],
+        )
+        assert np.array_equal(
+            reader.read(0, steps=[17, 16, 40, 17, -1]), expected[[17, 16, 40, 17, -1]]
+        )
+        assert np.array_equal(reader.read(0, steps=slice(30, 10)), expected[30:10])
+        assert np.array_equal(reader.read(0, steps=slice(45, 3, -4)), expected[45:3:-4])
+        with pytest.raises(IndexError):
+            reader.read(0, steps=[50])
+        for key in [(1, 0, 0), (0, -1, 0), (0, 0, -1), (0, 7, 0), (0, 0, 3)]:
+            with pytest.raises(IndexError, match="No chunk|No such realization"):
+                reader.chunk(*key)
+
+
+def test_uncompressed_chunks_are_memory_mapped(tmp_path):
+    path = tmp_path / "trajectories"
+    with TrajectoryWriter(path, VECTORS, compression_level=0) as writer:
+        writer.append(0, _values(0))
+
+    with TrajectoryReader(path) as reader:
+        chunk = reader.chunk(0, 0, 0)
+        assert isinstance(chunk.base, np.memmap) or isinstance(chunk, np.memmap)
+
+
+def test_compression_reduces_size(tmp_path):
+    sim = OilSimulator()
+    for well in range(4):
+        sim.add_well(f"OP{well}", seed=well + 1)
+    result = sim.evaluate(np.linspace(0.0, 1.0, 1000), scale=0.001)
+    vectors = ["fopr", "fopt", "fgpr", "fgpt", "fwpr", "fwpt", "foip"]
+    values = np.column_stack([getattr(result, vector)() for vector in vectors])
+
+    sizes = {}
+    for level in (0, 9):
+        path = tmp_path / f"level{level}"
+        with TrajectoryWriter(path, vectors, compression_level=level) as writer:
+            writer.append(0, values)
+        with TrajectoryReader(path) as reader:
+            sizes[level] = reader.stored_bytes
+            assert np.array_equal(reader.read(0), values.astype("float32"))
+
+    assert sizes[9] < sizes[0]
+
+
+def test_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        TrajectoryWriter(tmp_path / "a", VECTORS, dtype="int32")
+    with pytest.raises(ValueError):
+        TrajectoryWriter(tmp_path / "b", VECTORS, compression_level=10)
+
+    with TrajectoryWriter(tmp_path / "c", VECTORS) as writer, pytest.raises(ValueError):
+        writer.append(0, np.zeros(len(VECTORS) + 1))
+
+    (tmp_path / "d").write_bytes(b"not a trajectory file at all")
+    with pytest.raises(ValueError):
+        TrajectoryReader(tmp_path / "d")
+
+
+def test_append_rejects_closed_writer_and_invalid_realization(tmp_path):
+    writer = TrajectoryWriter(tmp_path / "trajectories", VECTORS)
+    with pytest.raises(IndexError):
+        writer.append(0.5, _values(0))
+    with pytest.raises(IndexError):
+        writer.append(-1, _values(0))
+    writer.append(np.int64(0), _values(0))
+    writer.close()
+
+    with pytest.raises(ValueError):
+        writer.append(0, _values(0))
+    with TrajectoryReader(tmp_path / "trajectories") as reader:
+        assert reader.num_realizations == 1